@@ -1,37 +1,69 @@
-from flask import Flask, request, jsonify, send_file, render_template_string
+from flask import Flask, request, jsonify, send_file, Response, stream_with_context
 from flask_cors import CORS
+import asyncio
+import collections
+import csv
+import hashlib
+import time
 import io
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import json
+import re
+import traceback
+import anthropic
+from bs4 import BeautifulSoup
 from scraper import GenericScraper
 from csv_writer import EventCSVWriter
+import llm_cache
 import os
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled once; pulls the JSON array out of the model's response text
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+# Markers that suggest a page actually contains events; used to skip the AI
+# call on 404 pages, empty calendars, and the like
+_EVENT_SIGNAL_RE = re.compile(r'(?i)\b(event|show|concert|doors|\d{1,2}:\d{2}\s*(am|pm))\b')
+
+# Pulls JSON-LD blocks straight out of raw HTML without building a DOM
+_JSONLD_SCRIPT_RE = re.compile(
+    r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE)
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when available (3-5x faster), stdlib otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Load environment variables
 load_dotenv()
 
+# Use uvloop for the async fetch path when available (not on Windows)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# One client per worker: keeps the pooled TLS connection to the API warm
+# across calls instead of paying a fresh handshake every request
+_ANTHROPIC = (anthropic.Anthropic(api_key=os.environ['ANTHROPIC_API_KEY'])
+              if os.environ.get('ANTHROPIC_API_KEY') else None)
+
 app = Flask(__name__)
 CORS(app)
 
-def extract_events_with_ai(html_content, venue_name):
-    """Use Claude AI to extract events from HTML."""
-    try:
-        import anthropic
-        
-        # Check for API key
-        api_key = os.environ.get('ANTHROPIC_API_KEY')
-        if not api_key:
-            print("Warning: ANTHROPIC_API_KEY not found in environment")
-            return []
-        
-        # Truncate HTML if too long (keep first 100k chars)
-        if len(html_content) > 100000:
-            html_content = html_content[:100000]
-        
-        client = anthropic.Anthropic(api_key=api_key)
-        
-        prompt = f"""You are a web scraping assistant. Extract all music events from this HTML.
-
-Venue name: {venue_name}
+# Static part of the extraction prompt. Kept byte-identical across calls and
+# marked with cache_control so Anthropic can reuse the cached prefix.
+STATIC_INSTRUCTIONS = """You are a web scraping assistant. Extract all music events from this HTML.
 
 For each event, extract:
 - Event Name (required)
@@ -42,37 +74,296 @@ For each event, extract:
 
 Return ONLY valid JSON in this exact format:
 [
-  {{
+  {
     "Event Name": "...",
     "Event Start Time": "...",
     "Event Image URL": "...",
     "Venue Permalink": "...",
     "Description Text": "..."
-  }}
-]
+  }
+]"""
 
-HTML:
-{html_content}"""
+# Prebuilt row template so normalizing an event is a copy + sparse update
+# instead of rebuilding an 18-key dict from scratch per event
+_ROW_TEMPLATE = dict.fromkeys(EventCSVWriter.COLUMNS, '')
 
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=4000,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        
-        response_text = message.content[0].text
-        
-        # Parse JSON response
-        import json
-        import re
-        
-        # Extract JSON from response (in case there's explanatory text)
-        json_match = re.search(r'\[.*\]', response_text, re.DOTALL)
-        if json_match:
-            events_data = json.loads(json_match.group(0))
+class _CSVLineBuffer:
+    """Fake file object whose write() just returns the line to the caller."""
+    def write(self, line):
+        return line
+
+def _stream_csv_response(rows, columns, filename):
+    """Stream event rows as a CSV attachment, one row at a time."""
+    def generate():
+        writer = csv.DictWriter(_CSVLineBuffer(), fieldnames=columns,
+                                quoting=csv.QUOTE_NONNUMERIC)
+        yield writer.writeheader()
+        for row in rows:
+            yield writer.writerow(row)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/csv',
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
+# Short-TTL cache of processed scrape results so double-clicking "Scrape"
+# doesn't pay the network + LLM cost twice. Keyed by URL (or HTML hash).
+_RESP_CACHE = collections.OrderedDict()
+_RESP_CACHE_TTL = 300  # seconds
+_RESP_CACHE_MAX = 32
+
+def _resp_cache_get(key):
+    """Return cached rows for key, or None on miss/expiry."""
+    hit = _RESP_CACHE.get(key)
+    if not hit:
+        return None
+    timestamp, rows = hit
+    if time.time() - timestamp >= _RESP_CACHE_TTL:
+        del _RESP_CACHE[key]
+        return None
+    _RESP_CACHE.move_to_end(key)
+    return rows
+
+def _resp_cache_set(key, rows):
+    """Store rows for key, evicting the least recently used past 32 entries."""
+    _RESP_CACHE[key] = (time.time(), rows)
+    _RESP_CACHE.move_to_end(key)
+    while len(_RESP_CACHE) > _RESP_CACHE_MAX:
+        _RESP_CACHE.popitem(last=False)
+
+def _buffered_csv_response(rows, columns, filename):
+    """
+    Buffered variant of _stream_csv_response for clients that need a
+    Content-Length header. Small responses stay in memory; anything past 1MB
+    spills to disk so large CSVs never live fully in RAM.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=1 << 20, mode='w+b')
+    text = io.TextIOWrapper(spool, encoding='utf-8', newline='')
+    csv_writer = csv.DictWriter(text, fieldnames=columns, quoting=csv.QUOTE_NONNUMERIC)
+    csv_writer.writeheader()
+    csv_writer.writerows(rows)
+    text.flush()
+    text.detach()
+    size = spool.seek(0, 2)
+    spool.seek(0)
+
+    resp = send_file(
+        spool,
+        mimetype='text/csv',
+        as_attachment=True,
+        download_name=filename
+    )
+    # send_file can't size a bare SpooledTemporaryFile, and Content-Length
+    # is the whole point of the buffered mode
+    resp.headers['Content-Length'] = str(size)
+    return resp
+
+def _jsonld_loads(raw):
+    """Decode one JSON-LD block, returning None on malformed input."""
+    try:
+        return _json_loads(raw)
+    except (json.JSONDecodeError, AttributeError) as e:
+        print(f"Error parsing JSON-LD: {e}")
+        return None
+
+def _event_from_jsonld(event_data, venue_name):
+    """Build an event dict from one JSON-LD Event object."""
+    return {
+        'Hold Level': '1',
+        'Artist': event_data.get('name', ''),
+        'Type': 'Confirm',
+        'Venue': event_data.get('location', {}).get('name', venue_name),
+        'Event Name': event_data.get('name', ''),
+        'Buyer': '',
+        'Promoter': '',
+        'Event End Time': event_data.get('endDate', ''),
+        'Event Start Time': event_data.get('startDate', ''),
+        'Event Door Time': '',
+        'Event Image URL': event_data.get('image', ''),
+        'Notes': '',
+        'Venue Permalink': event_data.get('url', ''),
+        'Description Text': event_data.get('description', ''),
+        'Description Image': event_data.get('image', ''),
+        'Description Video': '',
+        'Contacts': '',
+        'ID': ''
+    }
+
+def _events_from_blocks(raw_blocks, venue_name):
+    """Decode raw JSON-LD blocks and build event dicts from the Event ones."""
+    if len(raw_blocks) >= 8:
+        # Widget-heavy pages (embedded calendars, Eventbrite) can carry dozens
+        # of blocks totalling MBs of JSON; decode them across a thread pool
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            parsed = list(executor.map(_jsonld_loads, raw_blocks))
+    else:
+        # Single-script pages shouldn't pay pool overhead
+        parsed = [_jsonld_loads(raw) for raw in raw_blocks]
+
+    return [_event_from_jsonld(data, venue_name) for data in parsed
+            if isinstance(data, dict) and data.get('@type') == 'Event']
+
+def _csv_response(rows, filename):
+    """Pick the buffered or streaming response based on ?buffered."""
+    if request.args.get('buffered'):
+        return _buffered_csv_response(rows, EventCSVWriter.COLUMNS, filename)
+    return _stream_csv_response(rows, EventCSVWriter.COLUMNS, filename)
+
+def _parse_jsonld_fast(html_content, venue_name):
+    """
+    Fast path: pull JSON-LD blocks out of the raw HTML with one regex scan,
+    skipping DOM construction entirely for structured pages.
+    """
+    raw_blocks = _JSONLD_SCRIPT_RE.findall(html_content)
+    if not raw_blocks:
+        return []
+
+    print(f"Found {len(raw_blocks)} JSON-LD scripts (fast path), extracting structured data...")
+    return _events_from_blocks(raw_blocks, venue_name)
+
+def _parse_jsonld(soup, venue_name):
+    """Extract events from JSON-LD structured data blocks, if any."""
+    json_ld_scripts = soup.find_all('script', type='application/ld+json')
+    if not json_ld_scripts:
+        return []
+
+    print(f"Found {len(json_ld_scripts)} JSON-LD scripts, extracting structured data...")
+
+    # str() because orjson rejects bs4's NavigableString subclass
+    raw_blocks = [str(script.string) for script in json_ld_scripts if script.string]
+    return _events_from_blocks(raw_blocks, venue_name)
+
+def _compact_html(html_content):
+    """
+    Strip non-content tags and collapse whitespace so a truncated slice keeps
+    event markup instead of <head>/<style> boilerplate.
+    """
+    soup = BeautifulSoup(html_content, 'lxml')
+    for tag in soup(['script', 'style', 'noscript', 'svg', 'iframe', 'head']):
+        tag.decompose()
+    return re.sub(r'\s+', ' ', str(soup.body or soup))
+
+def _build_messages(venue_name, html_content):
+    """Messages payload: cached static prefix first, variable HTML last."""
+    return [{
+        "role": "user",
+        "content": [
+            {
+                "type": "text",
+                "text": STATIC_INSTRUCTIONS,
+                "cache_control": {"type": "ephemeral"}
+            },
+            {
+                "type": "text",
+                "text": f"Venue name: {venue_name}\n\nHTML:\n{html_content}"
+            }
+        ]
+    }]
+
+def _parse_model_response(message):
+    """Pull the JSON event array out of one model response."""
+    response_text = message.content[0].text
+
+    # Extract JSON from response (in case there's explanatory text)
+    json_match = _JSON_ARRAY_RE.search(response_text)
+    try:
+        return _json_loads(json_match.group(0) if json_match else response_text)
+    except json.JSONDecodeError as e:
+        print(f"Error parsing model response: {e}")
+        return []
+
+# Boundaries the chunker prefers to cut on, so events aren't split mid-card
+_CHUNK_SPLIT_RE = re.compile(r'</article>|</li>', re.IGNORECASE)
+
+def _split_html(html_content, window=80000):
+    """Split compacted HTML into windows, cutting on event-card boundaries."""
+    chunks = []
+    start = 0
+    length = len(html_content)
+    while start < length:
+        if length - start <= window:
+            chunks.append(html_content[start:])
+            break
+        # Cut at the last card boundary inside the window when there is one
+        cut = None
+        for match in _CHUNK_SPLIT_RE.finditer(html_content, start, start + window):
+            cut = match.end()
+        if cut is None or cut - start < window // 2:
+            cut = start + window
+        chunks.append(html_content[start:cut])
+        start = cut
+    return chunks
+
+async def _extract_chunks_async(venue_name, chunks):
+    """Fire one extraction call per chunk concurrently, capped at 3 in flight."""
+    client = anthropic.AsyncAnthropic(api_key=os.environ['ANTHROPIC_API_KEY'])
+    semaphore = asyncio.Semaphore(3)  # respect API rate limits
+
+    async def extract(chunk):
+        async with semaphore:
+            return await client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=4000,
+                messages=_build_messages(venue_name, chunk)
+            )
+
+    try:
+        return await asyncio.gather(*(extract(chunk) for chunk in chunks))
+    finally:
+        await client.close()
+
+def extract_events_with_ai(html_content, venue_name):
+    """Use Claude AI to extract events from HTML."""
+    try:
+        # Check for API key
+        if _ANTHROPIC is None:
+            print("Warning: ANTHROPIC_API_KEY not found in environment")
+            return []
+
+        # Compact the HTML so the token budget is spent on event markup
+        html_content = _compact_html(html_content)
+
+        # Cheap pre-filter: don't spend an API call on pages with no
+        # event-like content at all
+        signal = sum(1 for _ in _EVENT_SIGNAL_RE.finditer(html_content))
+        if signal < 3:
+            print(f"Skipping AI extraction for {venue_name}: only {signal} event-like markers found")
+            return []
+
+        # Check the disk cache before spending an API call on identical input
+        cache_key = llm_cache.make_key(venue_name, html_content)
+        cached_events = llm_cache.get(cache_key)
+        if cached_events is not None:
+            print(f"LLM cache hit for {venue_name} ({len(cached_events)} events)")
+            return cached_events
+
+        if len(html_content) > 100000:
+            # Too big for one call: split on card boundaries and extract the
+            # chunks concurrently instead of dropping the tail
+            chunks = _split_html(html_content)
+            print(f"Splitting {len(html_content)} chars into {len(chunks)} chunks for extraction")
+            responses = asyncio.run(_extract_chunks_async(venue_name, chunks))
+
+            events_data = []
+            for message in responses:
+                events_data.extend(_parse_model_response(message))
+
+            # Overlapping chunk boundaries can return the same event twice
+            merged = {}
+            for event_data in events_data:
+                if isinstance(event_data, dict):
+                    key = event_data.get('Venue Permalink') or event_data.get('Event Name', '')
+                    merged[key] = event_data
+            events_data = list(merged.values())
         else:
-            events_data = json.loads(response_text)
-        
+            message = _ANTHROPIC.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=4000,
+                messages=_build_messages(venue_name, html_content)
+            )
+            events_data = _parse_model_response(message)
+
         # Convert to required format
         events = []
         for event_data in events_data:
@@ -99,6 +390,12 @@ HTML:
             if event['Event Name']:
                 events.append(event)
         
+        # Only cache non-empty results: an empty list may just mean a
+        # truncated or malformed model response, and the disk cache has no
+        # TTL to age that out
+        if events:
+            llm_cache.set(cache_key, events, model="claude-sonnet-4-20250514")
+
         print(f"AI extracted {len(events)} events")
         return events
         
@@ -275,9 +572,16 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# The template has no substitutions, so skip Jinja and serve fixed bytes
+_HTML_BYTES = HTML_TEMPLATE.encode('utf-8')
+_HTML_ETAG = hashlib.md5(_HTML_BYTES).hexdigest()
+
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    if request.headers.get('If-None-Match') == _HTML_ETAG:
+        return Response(status=304, headers={'ETag': _HTML_ETAG})
+    return Response(_HTML_BYTES, mimetype='text/html',
+                    headers={'ETag': _HTML_ETAG, 'Cache-Control': 'public, max-age=300'})
 
 @app.route('/scrape', methods=['POST'])
 def scrape_events():
@@ -294,56 +598,34 @@ def scrape_events():
         except:
             venue_name = 'venue'
         
+        # Serve a recent identical scrape straight from memory
+        cache_key = url
+        cached_rows = _resp_cache_get(cache_key)
+        if cached_rows is not None:
+            print(f"Response cache hit for {url}")
+            return _csv_response(cached_rows, f'{venue_name}_events.csv')
+
         print(f"Scraping {venue_name} at {url}...")
-        
+
         # Run scraper
         scraper = GenericScraper(venue_name=venue_name, venue_url=url)
-        soup = scraper.fetch_page(url)
-        
-        if not soup:
+        html_content = scraper.fetch_html(url)
+
+        if not html_content:
             return jsonify({'error': 'Could not fetch the page'}), 500
-        
-        # First, try to extract from JSON-LD structured data
-        import json
-        events = []
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
-        
-        if json_ld_scripts:
-            print(f"Found {len(json_ld_scripts)} JSON-LD scripts, extracting structured data...")
-            for script in json_ld_scripts:
-                try:
-                    event_data = json.loads(script.string)
-                    if event_data.get('@type') == 'Event':
-                        # Extract event information from JSON-LD
-                        event = {
-                            'Hold Level': '1',
-                            'Artist': event_data.get('name', ''),
-                            'Type': 'Confirm',
-                            'Venue': event_data.get('location', {}).get('name', venue_name),
-                            'Event Name': event_data.get('name', ''),
-                            'Buyer': '',
-                            'Promoter': '',
-                            'Event End Time': event_data.get('endDate', ''),
-                            'Event Start Time': event_data.get('startDate', ''),
-                            'Event Door Time': '',
-                            'Event Image URL': event_data.get('image', ''),
-                            'Notes': '',
-                            'Venue Permalink': event_data.get('url', ''),
-                            'Description Text': event_data.get('description', ''),
-                            'Description Image': event_data.get('image', ''),
-                            'Description Video': '',
-                            'Contacts': '',
-                            'ID': ''
-                        }
-                        events.append(event)
-                except (json.JSONDecodeError, AttributeError) as e:
-                    print(f"Error parsing JSON-LD: {e}")
-                    continue
-        
-        # If no JSON-LD data found, fall back to generic scraper
+
+        # First, try to extract JSON-LD straight from the raw HTML
+        events = _parse_jsonld_fast(html_content, venue_name)
+
+        # On a miss, build the full DOM and look again
+        if not events:
+            soup = BeautifulSoup(html_content, 'lxml')
+            events = _parse_jsonld(soup, venue_name)
+
+        # If no JSON-LD data found, fall back to AI extraction
         if not events:
             print("No JSON-LD data found, using AI extraction...")
-            events = extract_events_with_ai(str(soup), venue_name)
+            events = extract_events_with_ai(html_content, venue_name)
         
         if not events:
             return jsonify({'error': 'No events found. The page structure might not be supported.'}), 404
@@ -352,53 +634,33 @@ def scrape_events():
         
         # Use CSV writer to format events properly (with time calculations)
         writer = EventCSVWriter(output_path='temp_events.csv')
-        
-        # Create CSV in memory
-        output = io.StringIO()
-        
-        # Write events using the CSV writer's formatting
-        import pandas as pd
-        import csv
-        
+
         # Normalize events to match expected columns
         normalized_events = []
         for event in events:
-            normalized = {col: event.get(col, '') for col in writer.COLUMNS}
+            normalized = _ROW_TEMPLATE.copy()
+            normalized.update((k, event[k]) for k in event.keys() & _ROW_TEMPLATE.keys())
             normalized_events.append(normalized)
-        
-        # Convert to DataFrame and apply processing
-        df = pd.DataFrame(normalized_events)
-        
-        # Filter out invalid events
-        df = df[df['Venue Permalink'].notna() & (df['Venue Permalink'] != '')]
-        df = df[df['Event Name'].notna() & (df['Event Name'] != '')]
-        
-        # Remove duplicates
-        df = df.drop_duplicates(subset=['Venue Permalink'], keep='last')
-        
+
+        # Drop invalid events and dedupe by permalink (keep last, like the writer)
+        unique = {}
+        for event in normalized_events:
+            permalink = event['Venue Permalink']
+            if permalink and event['Event Name']:
+                unique[permalink] = event
+
         # Calculate door and end times
-        df = writer._calculate_times(df)
-        
-        # Write to string
-        df.to_csv(output, index=False, quoting=csv.QUOTE_NONNUMERIC)
-        
-        # Convert to bytes for sending
-        output.seek(0)
-        byte_output = io.BytesIO(output.getvalue().encode('utf-8'))
-        byte_output.seek(0)
-        
-        print(f"Returning CSV with {len(df)} events")
-        
-        return send_file(
-            byte_output,
-            mimetype='text/csv',
-            as_attachment=True,
-            download_name=f'{venue_name}_events.csv'
-        )
-    
+        rows = writer.calculate_times_rows(list(unique.values()))
+
+        print(f"Returning CSV with {len(rows)} events")
+
+        # Stream rows as they are serialized instead of buffering the whole CSV;
+        # ?buffered=1 opts into a spooled response with a Content-Length header
+        _resp_cache_set(cache_key, rows)
+        return _csv_response(rows, f'{venue_name}_events.csv')
+
     except Exception as e:
         print(f"Error: {str(e)}")
-        import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
@@ -412,49 +674,23 @@ def scrape_html():
         if not html_content:
             return jsonify({'error': 'No HTML content provided'}), 400
         
+        # Serve a recent identical paste straight from memory
+        cache_key = 'html:' + hashlib.sha256(html_content.encode()).hexdigest()
+        cached_rows = _resp_cache_get(cache_key)
+        if cached_rows is not None:
+            print(f"Response cache hit for pasted HTML ({venue_name})")
+            return _csv_response(cached_rows, f'{venue_name}_events.csv')
+
         print(f"Scraping HTML for {venue_name}...")
-        
-        # Parse HTML directly with BeautifulSoup
-        from bs4 import BeautifulSoup
-        import json
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # First, try to extract from JSON-LD structured data (common in modern sites)
-        events = []
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
-        
-        if json_ld_scripts:
-            print(f"Found {len(json_ld_scripts)} JSON-LD scripts, extracting structured data...")
-            for script in json_ld_scripts:
-                try:
-                    event_data = json.loads(script.string)
-                    if event_data.get('@type') == 'Event':
-                        # Extract event information from JSON-LD
-                        event = {
-                            'Hold Level': '1',
-                            'Artist': event_data.get('name', ''),
-                            'Type': 'Confirm',
-                            'Venue': event_data.get('location', {}).get('name', venue_name),
-                            'Event Name': event_data.get('name', ''),
-                            'Buyer': '',
-                            'Promoter': '',
-                            'Event End Time': event_data.get('endDate', ''),
-                            'Event Start Time': event_data.get('startDate', ''),
-                            'Event Door Time': '',
-                            'Event Image URL': event_data.get('image', ''),
-                            'Notes': '',
-                            'Venue Permalink': event_data.get('url', ''),
-                            'Description Text': event_data.get('description', ''),
-                            'Description Image': event_data.get('image', ''),
-                            'Description Video': '',
-                            'Contacts': '',
-                            'ID': ''
-                        }
-                        events.append(event)
-                except (json.JSONDecodeError, AttributeError) as e:
-                    print(f"Error parsing JSON-LD: {e}")
-                    continue
-        
+
+        # First, try to extract JSON-LD straight from the raw HTML
+        events = _parse_jsonld_fast(html_content, venue_name)
+
+        # On a miss, build the full DOM and look again (common in modern sites)
+        if not events:
+            soup = BeautifulSoup(html_content, 'lxml')
+            events = _parse_jsonld(soup, venue_name)
+
         # If no JSON-LD data found, use AI to parse the HTML
         if not events:
             print("No JSON-LD data found, using AI extraction...")
@@ -467,53 +703,33 @@ def scrape_html():
         
         # Use CSV writer to format events properly
         writer = EventCSVWriter(output_path='temp_events.csv')
-        
-        # Create CSV in memory
-        output = io.StringIO()
-        
-        # Write events using the CSV writer's formatting
-        import pandas as pd
-        import csv
-        
+
         # Normalize events
         normalized_events = []
         for event in events:
-            normalized = {col: event.get(col, '') for col in writer.COLUMNS}
+            normalized = _ROW_TEMPLATE.copy()
+            normalized.update((k, event[k]) for k in event.keys() & _ROW_TEMPLATE.keys())
             normalized_events.append(normalized)
-        
-        # Convert to DataFrame and apply processing
-        df = pd.DataFrame(normalized_events)
-        
-        # Filter out invalid events
-        df = df[df['Venue Permalink'].notna() & (df['Venue Permalink'] != '')]
-        df = df[df['Event Name'].notna() & (df['Event Name'] != '')]
-        
-        # Remove duplicates
-        df = df.drop_duplicates(subset=['Venue Permalink'], keep='last')
-        
+
+        # Drop invalid events and dedupe by permalink (keep last, like the writer)
+        unique = {}
+        for event in normalized_events:
+            permalink = event['Venue Permalink']
+            if permalink and event['Event Name']:
+                unique[permalink] = event
+
         # Calculate door and end times
-        df = writer._calculate_times(df)
-        
-        # Write to string
-        df.to_csv(output, index=False, quoting=csv.QUOTE_NONNUMERIC)
-        
-        # Convert to bytes for sending
-        output.seek(0)
-        byte_output = io.BytesIO(output.getvalue().encode('utf-8'))
-        byte_output.seek(0)
-        
-        print(f"Returning CSV with {len(df)} events")
-        
-        return send_file(
-            byte_output,
-            mimetype='text/csv',
-            as_attachment=True,
-            download_name=f'{venue_name}_events.csv'
-        )
+        rows = writer.calculate_times_rows(list(unique.values()))
+
+        print(f"Returning CSV with {len(rows)} events")
+
+        # Stream rows as they are serialized instead of buffering the whole CSV;
+        # ?buffered=1 opts into a spooled response with a Content-Length header
+        _resp_cache_set(cache_key, rows)
+        return _csv_response(rows, f'{venue_name}_events.csv')
     
     except Exception as e:
         print(f"Error: {str(e)}")
-        import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
@@ -522,6 +738,10 @@ def health():
     return jsonify({'status': 'ok'})
 
 if __name__ == '__main__':
-    import os
-    port = int(os.environ.get('PORT', 5001))
-    app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
+    # Dev server only; production runs: gunicorn -c gunicorn.conf.py app:app
+    if os.environ.get('FLASK_DEV'):
+        port = int(os.environ.get('PORT', 5001))
+        app.run(host='0.0.0.0', port=port, debug=True)
+    else:
+        print("Refusing to start the single-threaded dev server without FLASK_DEV=1.")
+        print("Use: gunicorn -c gunicorn.conf.py app:app")
\ No newline at end of file
@@ -2,12 +2,156 @@
 CSV writer module to format and save events in the required format.
 """
 import csv
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Optional
 from pathlib import Path
 from datetime import datetime, timedelta
 import re
 
+# Imported once here; the per-call `from dateutil import parser` lookup on
+# the parse slow path added up across large CSVs
+try:
+    from dateutil import parser as _dateutil_parser
+except ImportError:
+    _dateutil_parser = None
+
+# PyArrow writes string-heavy CSVs several times faster than pandas;
+# fall back to df.to_csv when it isn't installed
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+
+# Compiled once at import; these patterns run on every row
+_DOORS_RE = re.compile(r'Doors:\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm)?)', re.I)
+_TIME_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(AM|PM|am|pm)?', re.I)
+
+# All the patterns _extract_time_from_text needs, fused into one alternation
+# so the scanner walks the string once instead of once per pattern
+_COMBINED_RE = re.compile(
+    r'(?P<show>Show:\s*(?P<show_time>\d{1,2}(?::\d{2})?\s*(?:AM|PM)?))'
+    r'|(?P<doors>Doors:\s*(?P<doors_time>\d{1,2}(?::\d{2})?\s*(?:AM|PM)?))'
+    r'|(?P<date>\w+\s+\d{1,2},?\s+\d{4}|\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    re.I,
+)
+
+# Output of _format_datetime; rows already in this shape need no re-processing
+_FORMATTED_RE = re.compile(r'^\d{2}/\d{2}/\d{4} \d{1,2}:\d{2} [AP]M EST$')
+
+# Pattern: "Nov 26, 2025 5:30 pm" or "November 26, 2025 5:30 pm"
+_MONTH_DATE_RE = re.compile(r'(\w+)\s+(\d{1,2}),?\s+(\d{4})(?:\s+(\d{1,2}):(\d{2})\s*(am|pm))?', re.I)
+
+_MONTH_MAP = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# Formats grouped by leading character; a string starting with a digit can
+# never match a month-name format (and vice versa), so only one group is tried
+_DIGIT_FORMATS = (
+    '%m/%d/%Y %I:%M %p',  # 03/18/2023 10:45 PM
+    '%m/%d/%Y %I:%M %p %Z',  # 03/18/2023 10:45 PM EST
+    '%m/%d/%Y',  # 11/26/2025
+    '%Y-%m-%d %H:%M:%S',  # ISO format
+    '%Y-%m-%dT%H:%M:%S',  # ISO format with T
+)
+_ALPHA_FORMATS = (
+    '%B %d, %Y %I:%M %p',  # November 26, 2025 5:30 pm
+    '%b %d, %Y %I:%M %p',  # Nov 26, 2025 5:30 pm
+    '%B %d, %Y',  # November 26, 2025
+    '%b %d, %Y',  # Nov 26, 2025
+)
+
+# (length, starts with digit) -> most likely format, tried before the loop;
+# each failed strptime costs a raise/catch, so guessing right first pays
+_FORMAT_BY_SHAPE = {
+    (10, True): '%m/%d/%Y',  # 11/26/2025
+    (18, True): '%m/%d/%Y %I:%M %p',  # 03/18/2023 9:45 PM
+    (19, True): '%m/%d/%Y %I:%M %p',  # 03/18/2023 10:45 PM
+}
+
+
+_NS_PER_HOUR = 3_600_000_000_000
+
+
+def _compute_times(start_ns: np.ndarray, door_ns: np.ndarray, door_mask: np.ndarray):
+    """
+    Time-arithmetic kernel over int64 nanosecond arrays: end = start + 3h,
+    door falls back to start - 1h where no explicit door time was found.
+    Rows whose start failed to parse carry garbage here and are masked out
+    by the caller.
+    """
+    end_ns = start_ns + 3 * _NS_PER_HOUR
+    door_ns = np.where(door_mask, door_ns, start_ns - _NS_PER_HOUR)
+    return door_ns, end_ns
+
+
+# Strings without a 4-digit year (e.g. "8:00 PM") get today's date filled
+# in by dateutil; those results must never be memoized, or a long-lived
+# worker keeps serving yesterday's date
+_HAS_YEAR_RE = re.compile(r'\d{4}')
+
+
+def _parse_datetime_impl(date_string: str) -> Optional[datetime]:
+    """Parse a cleaned date/time string into a datetime object."""
+    first_is_digit = date_string[0].isdigit()
+
+    # Best guess by shape first, then the rest of the matching group
+    shape_fmt = _FORMAT_BY_SHAPE.get((len(date_string), first_is_digit))
+    if shape_fmt:
+        try:
+            return datetime.strptime(date_string, shape_fmt)
+        except ValueError:
+            pass
+
+    for fmt in _DIGIT_FORMATS if first_is_digit else _ALPHA_FORMATS:
+        if fmt is shape_fmt:
+            continue
+        try:
+            return datetime.strptime(date_string, fmt)
+        except ValueError:
+            continue
+
+    # Try parsing with dateutil (more flexible); strings that don't start
+    # alphanumeric can't parse anyway, so don't pay for the raise
+    if _dateutil_parser is not None and date_string[0].isalnum():
+        try:
+            return _dateutil_parser.parse(date_string)
+        except (ValueError, TypeError):
+            pass
+
+    # Try regex-based parsing for formats like "Nov 26, 2025 5:30 pm"
+    match = _MONTH_DATE_RE.search(date_string)
+    if match:
+        month_str, day, year, hour, minute, am_pm = match.groups()
+        month = _MONTH_MAP.get(month_str[:3].casefold())
+        if month:
+            day = int(day)
+            year = int(year)
+            if hour and minute:
+                hour = int(hour)
+                minute = int(minute)
+                if am_pm and am_pm.lower() == 'pm' and hour != 12:
+                    hour += 12
+                elif am_pm and am_pm.lower() == 'am' and hour == 12:
+                    hour = 0
+                return datetime(year, month, day, hour, minute)
+            else:
+                return datetime(year, month, day)
+
+    return None
+
+
+# Many events share identical timestamps; repeat strings cost one dict
+# lookup instead of a parse
+_parse_datetime_cached = lru_cache(maxsize=8192)(_parse_datetime_impl)
+
 
 class EventCSVWriter:
     """Handles writing events to CSV in the required format."""
@@ -54,64 +198,15 @@ class EventCSVWriter:
         Returns:
             datetime object or None if parsing fails
         """
-        if not date_string or pd.isna(date_string) or date_string.strip() == '':
+        if not date_string or pd.isna(date_string) or str(date_string).strip() == '':
             return None
-        
-        date_string = str(date_string).strip()
-        
-        # Try various date formats
-        formats = [
-            '%m/%d/%Y %I:%M %p',  # 03/18/2023 10:45 PM
-            '%m/%d/%Y %I:%M %p %Z',  # 03/18/2023 10:45 PM EST
-            '%B %d, %Y %I:%M %p',  # November 26, 2025 5:30 pm
-            '%b %d, %Y %I:%M %p',  # Nov 26, 2025 5:30 pm
-            '%B %d, %Y',  # November 26, 2025
-            '%b %d, %Y',  # Nov 26, 2025
-            '%m/%d/%Y',  # 11/26/2025
-            '%Y-%m-%d %H:%M:%S',  # ISO format
-            '%Y-%m-%dT%H:%M:%S',  # ISO format with T
-        ]
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_string, fmt)
-            except ValueError:
-                continue
-        
-        # Try parsing with dateutil (more flexible)
-        try:
-            from dateutil import parser
-            return parser.parse(date_string)
-        except (ImportError, ValueError, TypeError):
-            pass
-        
-        # Try regex-based parsing for formats like "Nov 26, 2025 5:30 pm"
-        month_map = {
-            'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-            'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-        }
-        
-        # Pattern: "Nov 26, 2025 5:30 pm" or "November 26, 2025 5:30 pm"
-        pattern = r'(\w+)\s+(\d{1,2}),?\s+(\d{4})(?:\s+(\d{1,2}):(\d{2})\s*(am|pm))?'
-        match = re.search(pattern, date_string, re.IGNORECASE)
-        if match:
-            month_str, day, year, hour, minute, am_pm = match.groups()
-            month = month_map.get(month_str[:3].lower())
-            if month:
-                day = int(day)
-                year = int(year)
-                if hour and minute:
-                    hour = int(hour)
-                    minute = int(minute)
-                    if am_pm and am_pm.lower() == 'pm' and hour != 12:
-                        hour += 12
-                    elif am_pm and am_pm.lower() == 'am' and hour == 12:
-                        hour = 0
-                    return datetime(year, month, day, hour, minute)
-                else:
-                    return datetime(year, month, day)
-        
-        return None
+
+        cleaned = str(date_string).strip()
+        if _HAS_YEAR_RE.search(cleaned) is None:
+            # No explicit year means the result can depend on today's date;
+            # keep it out of the cache
+            return _parse_datetime_impl(cleaned)
+        return _parse_datetime_cached(cleaned)
     
     def _format_datetime(self, dt: datetime) -> str:
         """
@@ -151,6 +246,15 @@ class EventCSVWriter:
         
         return f"{month:02d}/{day:02d}/{year} {hour_12}:{minute:02d} {am_pm} EST"
     
+    def _format_series(self, series: pd.Series) -> pd.Series:
+        """
+        Vectorized _format_datetime: format a datetime64 Series as
+        MM/DD/YYYY H:MM PM EST using pandas' C-level strftime.
+        """
+        formatted = series.dt.strftime('%m/%d/%Y %I:%M %p')
+        # strftime zero-pads the hour; the target format doesn't
+        return formatted.str.replace(r' 0(\d:)', r' \1', regex=True) + ' EST'
+
     def _extract_time_from_text(self, text: str) -> Optional[datetime]:
         """
         Extract datetime from text that might contain "Doors: X // Show: Y" format.
@@ -171,29 +275,24 @@ class EventCSVWriter:
         if dt:
             return dt
         
-        # Look for "Show: X" or "Show: X pm" pattern
-        show_pattern = re.compile(r'Show:\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm)?)', re.I)
-        show_match = show_pattern.search(text)
-        
-        # Look for "Doors: X" pattern
-        doors_pattern = re.compile(r'Doors:\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm)?)', re.I)
-        doors_match = doors_pattern.search(text)
-        
-        # Extract date from the text
-        date_pattern = re.compile(r'(\w+\s+\d{1,2},?\s+\d{4}|\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', re.I)
-        date_match = date_pattern.search(text)
-        
+        # One pass over the text picks up the "Show:" time and the date together
+        show_time = None
+        date_str = None
+        for m in _COMBINED_RE.finditer(text):
+            if m.group('show') is not None and show_time is None:
+                show_time = m.group('show_time').strip()
+            elif m.group('date') is not None and date_str is None:
+                date_str = m.group('date')
+            if show_time and date_str:
+                break
+
         # If we have a date, try to combine with time
-        if date_match:
-            date_str = date_match.group(1)
+        if date_str:
             date_dt = self._parse_datetime(date_str)
-            
-            if date_dt and show_match:
-                # Extract show time
-                show_time = show_match.group(1).strip()
+
+            if date_dt and show_time:
                 # Parse the time
-                time_pattern = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(AM|PM|am|pm)?', re.I)
-                time_match = time_pattern.search(show_time)
+                time_match = _TIME_RE.search(show_time)
                 
                 if time_match:
                     hour = int(time_match.group(1))
@@ -213,10 +312,8 @@ class EventCSVWriter:
         
         # If no date found, try to parse just the time and use today's date
         # (This is a fallback - ideally we should have a date)
-        if show_match:
-            show_time = show_match.group(1).strip()
-            time_pattern = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(AM|PM|am|pm)?', re.I)
-            time_match = time_pattern.search(show_time)
+        if show_time:
+            time_match = _TIME_RE.search(show_time)
             
             if time_match:
                 hour = int(time_match.group(1))
@@ -237,6 +334,83 @@ class EventCSVWriter:
         
         return None
     
+    def _extract_door_time(self, text: str, start_dt: datetime) -> Optional[datetime]:
+        """
+        Pull a "Doors: X" time out of text, placed on the same date as start_dt.
+
+        Args:
+            text: Text that might contain a "Doors:" time
+            start_dt: Parsed start time supplying the date
+
+        Returns:
+            datetime object or None if no door time is present
+        """
+        doors_match = _DOORS_RE.search(text)
+        if not doors_match:
+            return None
+        return self._door_time_from_text(doors_match.group(1).strip(), start_dt)
+
+    def _door_time_from_text(self, time_text: str, start_dt: datetime) -> Optional[datetime]:
+        """Turn an already-extracted door time like "7pm" into a datetime."""
+        time_match = _TIME_RE.search(time_text)
+        if not time_match:
+            return None
+
+        hour = int(time_match.group(1))
+        minute = int(time_match.group(2)) if time_match.group(2) else 0
+        am_pm = time_match.group(3)
+
+        if am_pm:
+            if am_pm.upper() == 'PM' and hour != 12:
+                hour += 12
+            elif am_pm.upper() == 'AM' and hour == 12:
+                hour = 0
+        elif hour < 12:
+            hour += 12
+
+        # Use the same date as start time
+        return datetime(start_dt.year, start_dt.month, start_dt.day, hour, minute)
+
+    def calculate_times_rows(self, rows: List[Dict]) -> List[Dict]:
+        """
+        List-of-dicts counterpart of _calculate_times, for callers that don't
+        go through pandas. Applies the same rules: door time from "Doors:" text
+        or start - 1 hour, end time = start + 3 hours.
+
+        Args:
+            rows: List of event dictionaries (mutated in place)
+
+        Returns:
+            The same list with formatted times
+        """
+        for row in rows:
+            start_time_str = row.get('Event Start Time', '')
+            if not start_time_str or not str(start_time_str).strip():
+                continue
+
+            start_dt = self._extract_time_from_text(start_time_str)
+            if not start_dt:
+                start_dt = self._parse_datetime(start_time_str)
+            if not start_dt:
+                continue
+
+            door_dt = None
+            door_time_str = row.get('Event Door Time', '')
+            if door_time_str and str(door_time_str).strip():
+                door_dt = self._parse_datetime(door_time_str)
+            if not door_dt:
+                door_dt = self._extract_door_time(str(start_time_str), start_dt)
+            if not door_dt:
+                door_dt = start_dt - timedelta(hours=1)
+
+            end_dt = start_dt + timedelta(hours=3)
+
+            row['Event Start Time'] = self._format_datetime(start_dt)
+            row['Event Door Time'] = self._format_datetime(door_dt)
+            row['Event End Time'] = self._format_datetime(end_dt)
+
+        return rows
+
     def _calculate_times(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate door time and end time based on start time.
@@ -250,73 +424,139 @@ class EventCSVWriter:
         Returns:
             DataFrame with calculated times
         """
-        df = df.copy()
-        
-        for idx, row in df.iterrows():
-            start_time_str = row.get('Event Start Time', '')
-            door_time_str = row.get('Event Door Time', '')
-            
-            if pd.isna(start_time_str) or start_time_str == '':
-                continue
-            
-            # Extract start time from text
-            start_dt = self._extract_time_from_text(start_time_str)
-            
-            if not start_dt:
-                # Try parsing the raw string
-                start_dt = self._parse_datetime(start_time_str)
-            
-            if start_dt:
-                # Check if door time is already specified in the start time text
-                door_dt = None
-                if door_time_str and not pd.isna(door_time_str) and door_time_str.strip():
-                    door_dt = self._parse_datetime(door_time_str)
-                
-                # If no door time found, try to extract from start time text
-                if not door_dt:
-                    doors_pattern = re.compile(r'Doors:\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM|am|pm)?)', re.I)
-                    doors_match = doors_pattern.search(str(start_time_str))
-                    
-                    if doors_match:
-                        # Extract door time
-                        door_time_text = doors_match.group(1).strip()
-                        
-                        # Get date from start_dt (we already have it parsed)
-                        if start_dt:
-                            # Parse door time
-                            time_pattern = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(AM|PM|am|pm)?', re.I)
-                            time_match = time_pattern.search(door_time_text)
-                            
-                            if time_match:
-                                hour = int(time_match.group(1))
-                                minute = int(time_match.group(2)) if time_match.group(2) else 0
-                                am_pm = time_match.group(3)
-                                
-                                if am_pm:
-                                    if am_pm.upper() == 'PM' and hour != 12:
-                                        hour += 12
-                                    elif am_pm.upper() == 'AM' and hour == 12:
-                                        hour = 0
-                                elif hour < 12:
-                                    hour += 12
-                                
-                                # Use the same date as start time
-                                door_dt = datetime(start_dt.year, start_dt.month, start_dt.day, hour, minute)
-                
-                # If still no door time, calculate as 1 hour before start
-                if not door_dt:
-                    door_dt = start_dt - timedelta(hours=1)
-                
-                # Calculate end time (always 3 hours after start)
-                end_dt = start_dt + timedelta(hours=3)
-                
-                # Format all three times
-                df.at[idx, 'Event Start Time'] = self._format_datetime(start_dt)
-                df.at[idx, 'Event Door Time'] = self._format_datetime(door_dt)
-                df.at[idx, 'Event End Time'] = self._format_datetime(end_dt)
-        
+        # Shallow copy: only the three time columns get cloned (copy-on-write)
+        # instead of memcpy-ing all 18 string columns up front
+        df = df.copy(deep=False)
+
+        # Rows already in final MM/DD/YYYY H:MM PM EST form (prior writes read
+        # back on append/merge) are left alone instead of re-parsed. All three
+        # columns must match: a new row can arrive with a pre-formatted start
+        # but no door/end, and those still need computing
+        needs_work = ~(
+            df['Event Start Time'].astype(str).str.match(_FORMATTED_RE)
+            & df['Event Door Time'].astype(str).str.match(_FORMATTED_RE)
+            & df['Event End Time'].astype(str).str.match(_FORMATTED_RE)
+        )
+        if not needs_work.any():
+            return df
+
+        raw_start = df.loc[needs_work, 'Event Start Time']
+
+        # First chance: one vectorized pass through pandas' parser. Batches
+        # mixing tz-aware and naive strings (JSON-LD startDate carries an
+        # offset, scraped text doesn't) raise here even with errors='coerce';
+        # send those through the row-by-row fallback instead
+        try:
+            start_series = pd.to_datetime(raw_start, format='mixed', errors='coerce', cache=True)
+        except ValueError:
+            start_series = pd.Series(pd.NaT, index=raw_start.index, dtype='datetime64[ns]')
+
+        # All-offset input parses tz-aware, and to_numpy would then shift it
+        # to UTC while _format_series formats wall time. The output format is
+        # wall-clock EST text, so drop the tz up front
+        if isinstance(start_series.dtype, pd.DatetimeTZDtype):
+            start_series = start_series.dt.tz_localize(None)
+
+        # Only the rows pandas couldn't handle (e.g. "Doors: 7pm // Show: 8pm ...")
+        # fall back to the row-by-row Python parsers
+        def parse_start(value):
+            if pd.isna(value) or str(value).strip() == '':
+                return None
+            dt = self._extract_time_from_text(value) or self._parse_datetime(str(value))
+            # Keep wall-clock time; an aware datetime here would re-trigger
+            # the mixed-timezone raise in the fallback to_datetime below
+            if dt is not None and dt.tzinfo is not None:
+                dt = dt.replace(tzinfo=None)
+            return dt
+
+        missing = start_series.isna()
+        if missing.any():
+            # Whole weekends share one raw string; parse each distinct value
+            # once and broadcast the result back over the rows
+            missing_strs = raw_start[missing]
+            parsed = {s: parse_start(s) for s in missing_strs.unique()}
+            fallback = missing_strs.map(parsed)
+            start_series = start_series.mask(missing, pd.to_datetime(fallback, errors='coerce'))
+
+        # One vectorized pass pulls any "Doors:" time out of the raw text
+        doors_text = raw_start.astype(str).str.extract(_DOORS_RE, expand=False)
+
+        # Explicit door times: the pre-set column first, then the extracted "Doors:" time
+        def parse_door(door_value, door_text, start_dt):
+            if pd.isna(start_dt):
+                return None
+            if door_value and not pd.isna(door_value) and str(door_value).strip():
+                door_dt = self._parse_datetime(str(door_value))
+                if door_dt:
+                    return door_dt
+            if isinstance(door_text, str):
+                return self._door_time_from_text(door_text.strip(), start_dt)
+            return None
+
+        door_dts = [
+            parse_door(door_value, door_text, start_dt)
+            for door_value, door_text, start_dt
+            in zip(df.loc[needs_work, 'Event Door Time'], doors_text, start_series)
+        ]
+
+        # Arithmetic runs on the raw int64 nanosecond buffers in one shot
+        door_series = pd.to_datetime(pd.Series(door_dts, index=raw_start.index), errors='coerce')
+        door_ns, end_ns = _compute_times(
+            start_series.to_numpy(dtype='datetime64[ns]').view('int64'),
+            door_series.to_numpy(dtype='datetime64[ns]').view('int64'),
+            door_series.notna().to_numpy(),
+        )
+        door_series = pd.Series(door_ns.view('datetime64[ns]'), index=raw_start.index)
+        end_series = pd.Series(end_ns.view('datetime64[ns]'), index=raw_start.index)
+
+        # Format only the rows that parsed; everything else is left untouched
+        parsed_idx = start_series.index[start_series.notna()]
+        df.loc[parsed_idx, 'Event Start Time'] = self._format_series(start_series[parsed_idx])
+        df.loc[parsed_idx, 'Event Door Time'] = self._format_series(door_series[parsed_idx])
+        df.loc[parsed_idx, 'Event End Time'] = self._format_series(end_series[parsed_idx])
+
         return df
-    
+
+    def _read_existing_by_permalink(self) -> Dict[str, Dict]:
+        """
+        Read the existing CSV as a dict keyed by Venue Permalink, dropping
+        rows without a permalink or event name. Avoids pandas entirely for
+        the merge path.
+        """
+        with open(self.output_path, 'r', newline='', encoding='utf-8') as f:
+            return {
+                row['Venue Permalink']: row
+                for row in csv.DictReader(f)
+                if row.get('Venue Permalink') and row.get('Event Name')
+            }
+
+    def _write_df(self, df: pd.DataFrame):
+        """
+        Write a DataFrame to the output CSV, preferring PyArrow's C++ writer.
+        quoting_style='all_valid' mirrors QUOTE_NONNUMERIC for string frames.
+        """
+        if pa is not None:
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                pa_csv.write_csv(
+                    table, str(self.output_path),
+                    write_options=pa_csv.WriteOptions(quoting_style='all_valid'),
+                )
+                return
+            except Exception as e:
+                print(f"PyArrow CSV write failed ({e}); falling back to pandas")
+        df.to_csv(self.output_path, index=False, quoting=csv.QUOTE_NONNUMERIC)
+
+    def _write_rows(self, rows):
+        """Write rows to the output CSV with the standard columns and quoting."""
+        with open(self.output_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(
+                f, fieldnames=self.COLUMNS, restval='',
+                extrasaction='ignore', quoting=csv.QUOTE_NONNUMERIC,
+            )
+            writer.writeheader()
+            writer.writerows(rows)
+
     def write_events(self, events: List[Dict], append: bool = False):
         """
         Write events to CSV file.
@@ -328,25 +568,69 @@ class EventCSVWriter:
         if not events:
             print("No events to write.")
             return
-        
-        # Ensure all events have all required columns
-        normalized_events = []
-        for event in events:
-            normalized = {col: event.get(col, '') for col in self.COLUMNS}
-            normalized_events.append(normalized)
-        
-        # Convert to DataFrame for deduplication
-        df = pd.DataFrame(normalized_events)
-        
+
+        if not append:
+            # Fast path: dict-based dedup + csv.writer, no DataFrame at all.
+            # DataFrame construction dominates at the batch sizes we see.
+            seen = {}
+            filtered = 0
+            for event in events:
+                permalink = event.get('Venue Permalink')
+                if not permalink or not event.get('Event Name'):
+                    filtered += 1
+                    continue
+                seen[permalink] = {col: event.get(col, '') for col in self.COLUMNS}
+
+            if filtered:
+                print(f"Filtered out {filtered} invalid events (empty Venue Permalink or Event Name)")
+            duplicates = len(events) - filtered - len(seen)
+            if duplicates:
+                print(f"Removed {duplicates} duplicate events (same Venue Permalink)")
+
+            rows = list(seen.values())
+            if len(rows) > 1000:
+                # Big enough for the vectorized path to win
+                rows = self._calculate_times(pd.DataFrame(rows, columns=self.COLUMNS)).to_dict('records')
+            else:
+                rows = self.calculate_times_rows(rows)
+            self._write_rows(rows)
+            print(f"Wrote {len(rows)} unique events to {self.output_path}")
+            return
+
+        # Check if file exists and has data — one stat() covers both
+        try:
+            file_exists = self.output_path.stat().st_size > 0
+        except FileNotFoundError:
+            file_exists = False
+
+        # Kick off the existing-file read in the background so it overlaps
+        # the normalization and time parsing below
+        read_future = None
+        if file_exists:
+            executor = ThreadPoolExecutor(max_workers=1)
+            read_future = executor.submit(self._read_existing_by_permalink)
+            executor.shutdown(wait=False)
+
+        # Normalize to the required columns in one shot; pandas fills missing
+        # keys column-wise in C instead of N x 18 .get() calls
+        df = pd.DataFrame(events, columns=self.COLUMNS).fillna('')
+
         # Filter out invalid events (empty Venue Permalink or empty Event Name)
+        # with one combined mask -> one filtered copy instead of two
         initial_count = len(df)
-        df = df[df['Venue Permalink'].notna() & (df['Venue Permalink'] != '')]
-        df = df[df['Event Name'].notna() & (df['Event Name'] != '')]
-        
+        valid = (
+            df['Venue Permalink'].notna() & df['Venue Permalink'].ne('')
+            & df['Event Name'].notna() & df['Event Name'].ne('')
+        )
+        df = df[valid]
+
         if len(df) < initial_count:
             print(f"Filtered out {initial_count - len(df)} invalid events (empty Venue Permalink or Event Name)")
         
-        # Remove duplicates based on Venue Permalink (one row per unique permalink)
+        # Remove duplicates based on Venue Permalink (one row per unique permalink).
+        # Arrow-backed strings hash and compare in C++ instead of object-by-object
+        if pa is not None:
+            df['Venue Permalink'] = df['Venue Permalink'].astype('string[pyarrow]')
         before_dedup = len(df)
         df = df.drop_duplicates(subset=['Venue Permalink'], keep='last')
         
@@ -355,35 +639,23 @@ class EventCSVWriter:
         
         # Calculate door time and end time based on start time
         df = self._calculate_times(df)
-        
-        # Check if file exists and has data
-        file_exists = self.output_path.exists() and self.output_path.stat().st_size > 0
-        
-        if append and file_exists:
-            # Read existing data
+
+        if read_future is not None:
+            # Merge into a dict keyed by permalink: O(new rows) instead of
+            # concat + drop_duplicates over the whole file
             try:
-                existing_df = pd.read_csv(self.output_path)
-                # Filter existing data too
-                existing_df = existing_df[existing_df['Venue Permalink'].notna() & (existing_df['Venue Permalink'] != '')]
-                existing_df = existing_df[existing_df['Event Name'].notna() & (existing_df['Event Name'] != '')]
-                
-                # Combine and deduplicate
-                combined_df = pd.concat([existing_df, df], ignore_index=True)
-                combined_df = combined_df.drop_duplicates(subset=['Venue Permalink'], keep='last')
-                
-                # Calculate times for combined dataframe
-                combined_df = self._calculate_times(combined_df)
-                
-                combined_df.to_csv(self.output_path, index=False, quoting=csv.QUOTE_NONNUMERIC)
-                print(f"Appended {len(df)} events to {self.output_path} (total: {len(combined_df)} unique events)")
+                merged = read_future.result()
+                merged.update({row['Venue Permalink']: row for row in df.to_dict('records')})
+                self._write_rows(merged.values())
+                print(f"Appended {len(df)} events to {self.output_path} (total: {len(merged)} unique events)")
             except Exception as e:
                 print(f"Error appending to existing file: {e}")
                 # Fallback to overwrite
-                df.to_csv(self.output_path, index=False, quoting=csv.QUOTE_NONNUMERIC)
+                self._write_df(df)
                 print(f"Created new file with {len(df)} events at {self.output_path}")
         else:
             # Write new file
-            df.to_csv(self.output_path, index=False, quoting=csv.QUOTE_NONNUMERIC)
+            self._write_df(df)
             print(f"Wrote {len(df)} unique events to {self.output_path}")
     
     def merge_with_existing(self, events: List[Dict]):
@@ -393,43 +665,38 @@ class EventCSVWriter:
         Args:
             events: List of event dictionaries to merge
         """
-        normalized_events = []
-        for event in events:
-            normalized = {col: event.get(col, '') for col in self.COLUMNS}
-            normalized_events.append(normalized)
-        
-        # Convert to DataFrame
-        new_df = pd.DataFrame(normalized_events)
-        
-        # Filter invalid events
-        new_df = new_df[new_df['Venue Permalink'].notna() & (new_df['Venue Permalink'] != '')]
-        new_df = new_df[new_df['Event Name'].notna() & (new_df['Event Name'] != '')]
+        # Overlap the existing-file read with the new-event processing below
+        read_future = None
+        if self.output_path.exists():
+            executor = ThreadPoolExecutor(max_workers=1)
+            read_future = executor.submit(self._read_existing_by_permalink)
+            executor.shutdown(wait=False)
+
+        # Normalize to the required columns in one shot
+        new_df = pd.DataFrame(events, columns=self.COLUMNS).fillna('')
+
+        # Filter invalid events with one combined mask
+        valid = (
+            new_df['Venue Permalink'].notna() & new_df['Venue Permalink'].ne('')
+            & new_df['Event Name'].notna() & new_df['Event Name'].ne('')
+        )
+        new_df = new_df[valid]
         
         # Calculate times
         new_df = self._calculate_times(new_df)
         
-        if self.output_path.exists():
+        if read_future is not None:
             try:
-                existing_df = pd.read_csv(self.output_path)
-                # Filter existing data
-                existing_df = existing_df[existing_df['Venue Permalink'].notna() & (existing_df['Venue Permalink'] != '')]
-                existing_df = existing_df[existing_df['Event Name'].notna() & (existing_df['Event Name'] != '')]
-                
-                # Merge and deduplicate on Venue Permalink
-                merged_df = pd.concat([existing_df, new_df], ignore_index=True)
-                merged_df = merged_df.drop_duplicates(subset=['Venue Permalink'], keep='last')
-                
-                # Calculate times for merged dataframe
-                merged_df = self._calculate_times(merged_df)
-                
-                merged_df.to_csv(self.output_path, index=False, quoting=csv.QUOTE_NONNUMERIC)
-                print(f"Merged {len(new_df)} events into {self.output_path} (total: {len(merged_df)} unique events)")
+                merged = read_future.result()
+                merged.update({row['Venue Permalink']: row for row in new_df.to_dict('records')})
+                self._write_rows(merged.values())
+                print(f"Merged {len(new_df)} events into {self.output_path} (total: {len(merged)} unique events)")
             except Exception as e:
                 print(f"Error merging: {e}. Creating new file.")
                 new_df = new_df.drop_duplicates(subset=['Venue Permalink'], keep='last')
-                new_df.to_csv(self.output_path, index=False, quoting=csv.QUOTE_NONNUMERIC)
+                self._write_df(new_df)
         else:
             new_df = new_df.drop_duplicates(subset=['Venue Permalink'], keep='last')
-            new_df.to_csv(self.output_path, index=False, quoting=csv.QUOTE_NONNUMERIC)
+            self._write_df(new_df)
             print(f"Created new file with {len(new_df)} unique events at {self.output_path}")
 
@@ -0,0 +1,13 @@
+"""
+Gunicorn configuration for production deployments.
+
+Start with: gunicorn -c gunicorn.conf.py app:app
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5001)}"
+workers = 2 * (os.cpu_count() or 1) + 1
+worker_class = 'gevent'
+worker_connections = 100
+timeout = 120  # scrapes can be slow
+preload_app = True  # load pandas & co. once in the master, share COW across workers
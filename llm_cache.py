@@ -0,0 +1,64 @@
+"""
+Content-addressable disk cache for Claude extraction results.
+
+Enabled by setting the LLM_CACHE_DIR environment variable; when unset every
+call is a no-op and requests always go to the API.
+"""
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Optional
+
+# Bump when the extraction prompt changes so stale entries are not reused
+PROMPT_VERSION = 'v1'
+
+
+def make_key(venue_name: str, html_content: str) -> str:
+    """Build the cache key: sha256 of prompt version, venue name and HTML."""
+    hasher = hashlib.sha256()
+    hasher.update(PROMPT_VERSION.encode() + b'|')
+    hasher.update(venue_name.encode() + b'|')
+    hasher.update(html_content.encode())
+    return hasher.hexdigest()
+
+
+def _entry_path(key: str) -> Optional[Path]:
+    """Path for a cache entry, or None if the cache is disabled."""
+    cache_dir = os.environ.get('LLM_CACHE_DIR')
+    if not cache_dir:
+        return None
+    return Path(cache_dir) / key[:2] / f'{key}.json'
+
+
+def get(key: str) -> Optional[List[Dict]]:
+    """Return the cached events for key, or None on miss or disabled cache."""
+    path = _entry_path(key)
+    if not path or not path.exists():
+        return None
+    try:
+        with open(path) as f:
+            payload = json.load(f)
+        return payload['events']
+    except (json.JSONDecodeError, KeyError, OSError) as e:
+        print(f"Error reading LLM cache entry {path}: {e}")
+        return None
+
+
+def set(key: str, events: List[Dict], model: str = ''):
+    """Store events for key along with a timestamp and model id."""
+    path = _entry_path(key)
+    if not path:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'model': model,
+            'cached_at': datetime.now(timezone.utc).isoformat(),
+            'events': events,
+        }
+        with open(path, 'w') as f:
+            json.dump(payload, f)
+    except OSError as e:
+        print(f"Error writing LLM cache entry {path}: {e}")
@@ -1,14 +1,125 @@
 """
 Base scraper class and utilities for venue event scraping.
 """
+import asyncio
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from functools import lru_cache
 from typing import List, Dict, Optional
 from datetime import datetime
+import logging
 import re
+import sys
 import time
 from urllib.parse import urljoin, urlparse
 
+log = logging.getLogger(__name__)
+
+
+# Compiled once at import; the extractors run these against every element of
+# every page, and per-call re.compile dominated profile time there
+_RE_EVENT_CLASS = re.compile(r'event|show|concert', re.I)
+_RE_TICKET_TEXT = re.compile(r'buy tickets|get tickets|buy|tickets|rsvp|more info|learn more|read more|view details|details|sold out|live music|', re.I)
+_RE_BUY_TICKETS = re.compile(r'buy\s+tickets?|get\s+tickets?', re.I)
+_RE_TITLE_CLASS = re.compile(r'title|name|event', re.I)
+_RE_DATE_CLASS = re.compile(r'date|time', re.I)
+_RE_DESC_CLASS = re.compile(r'description|summary', re.I)
+
+# Full-text date/time patterns for elements without structured markup; one
+# alternation so the engine walks the text once instead of once per shape
+_RE_ANY_DATE = re.compile(
+    r'(\w+day,?\s+\w+\s+\d{1,2},?\s+\d{4})'  # Monday, November 25, 2024
+    r'|(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'  # 11/25/2024 or 11-25-2024
+    r'|(\w+\s+\d{1,2},?\s+\d{4})',  # November 25, 2024
+    re.I,
+)
+_RE_TIME = re.compile(r'(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))', re.I)
+_RE_BG_IMAGE = re.compile(r'background-image:\s*url\(["\']?([^"\']+)["\']?\)', re.I)
+
+# Selector tables for the generic extractor, built once instead of per call
+_RE_CONTAINER_CLASS = re.compile(r'event|show|concert|listing|post|card', re.I)
+_RE_ITEMTYPE_EVENT = re.compile(r'Event', re.I)
+_CONTAINER_TAGS = ['article', 'div', 'li', 'section']
+
+_NAME_SELECTORS = (
+    ('h1', {'class': _RE_TITLE_CLASS}),
+    ('h2', {'class': _RE_TITLE_CLASS}),
+    ('h3', {'class': _RE_TITLE_CLASS}),
+    ('a', {'class': _RE_TITLE_CLASS}),
+    ('span', {'class': _RE_TITLE_CLASS}),
+    ('div', {'class': _RE_TITLE_CLASS}),
+    ('h1', {}),
+    ('h2', {}),
+)
+
+_DATE_SELECTORS = (
+    ('time', {}),
+    ('span', {'class': re.compile(r'date|time|when', re.I)}),
+    ('div', {'class': re.compile(r'date|time|when', re.I)}),
+    ('p', {'class': re.compile(r'date|time|when', re.I)}),
+    ('div', {'class': re.compile(r'meta|info', re.I)}),
+)
+
+# Text literals checked against every candidate node
+_INVALID_NAMES = frozenset({
+    'buy tickets', 'get tickets', 'buy', 'tickets', 'rsvp', 'more info',
+    'learn more', 'read more', 'view details', 'details', 'sold out',
+})
+_INVALID_DATE_TEXTS = frozenset({'buy tickets', 'get tickets', 'buy', 'sold out'})
+_RE_BTN_TEXT = re.compile(r'get\s+tickets?|buy\s+tickets?|buy|sold\s+out', re.I)
+
+@lru_cache(maxsize=256)
+def compiled(pattern: str, flags: int = re.I) -> re.Pattern:
+    """
+    Compile-once cache for selector patterns built at runtime. Venue
+    subclasses that assemble patterns from venue data should go through
+    this instead of re.compile; the built-in patterns above are already
+    module constants.
+    """
+    return re.compile(pattern, flags)
+
+
+# Every parsed event starts as one copy of this template; the constant
+# values are shared singletons instead of fresh literals per event
+_EVENT_TEMPLATE = {
+    'Hold Level': '1',
+    'Artist': '',
+    'Type': 'Confirm',
+    'Venue': '',
+    'Event Name': '',
+    'Buyer': '',
+    'Promoter': '',
+    'Event End Time': '',
+    'Event Start Time': '',
+    'Event Door Time': '',
+    'Event Image URL': '',
+    'Notes': '',
+    'Venue Permalink': '',
+    'Description Text': '',
+    'Description Image': '',
+    'Description Video': '',
+    'Contacts': '',
+    'ID': ''
+}
+
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Only the tags the extractors ever touch; parsing with this strainer skips
+# script/style/head/svg subtrees entirely instead of building nodes for them
+_EVENT_STRAINER = SoupStrainer([
+    'article', 'div', 'li', 'section', 'a', 'time',
+    'h1', 'h2', 'h3', 'h4', 'span', 'p', 'img', 'button',
+])
+
+_DESC_SELECTORS = (
+    ('p', {'class': re.compile(r'description|summary|excerpt', re.I)}),
+    ('div', {'class': re.compile(r'description|summary|excerpt', re.I)}),
+    ('p', {}),
+)
+
 
 class EventScraper:
     """Base class for venue event scrapers."""
@@ -22,27 +133,111 @@ class EventScraper:
             venue_url: Base URL of the venue website
             delay: Delay between requests in seconds (to be respectful)
         """
-        self.venue_name = venue_name
+        # Interned: the same venue string lands in every event dict
+        self.venue_name = sys.intern(venue_name)
         self.venue_url = venue_url
         self.delay = delay
         self.session = requests.Session()
+        # Bigger keep-alive pool + retries: venues share hosts across
+        # scrapers, and reusing warm TLS connections skips the handshake
+        adapter = HTTPAdapter(
+            pool_connections=32, pool_maxsize=32,
+            max_retries=Retry(
+                total=3, backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': _USER_AGENT,
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate, br',
         })
+        # Throttle bookkeeping: -inf means the first request never waits
+        self._last_fetch = float('-inf')
     
+    def _throttle_wait(self) -> float:
+        """
+        Seconds still owed on the inter-request delay. Time already spent
+        parsing or writing between fetches counts toward the delay, so a
+        slow page costs no extra sleep on the next request.
+        """
+        return self.delay - (time.monotonic() - self._last_fetch)
+
+    def _join_url(self, url: str) -> str:
+        """
+        urljoin fast path: absolute URLs (the common case) come back as-is
+        instead of paying for a base-URL re-parse per call.
+        """
+        if url.startswith(('http://', 'https://')):
+            return url
+        return urljoin(self.venue_url, url)
+
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """Fetch and parse a webpage."""
         try:
-            time.sleep(self.delay)  # Be respectful to servers
+            wait = self._throttle_wait()
+            if wait > 0:
+                time.sleep(wait)  # Be respectful to servers
+            self._last_fetch = time.monotonic()
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            return BeautifulSoup(response.content, 'lxml', parse_only=_EVENT_STRAINER)
         except Exception as e:
-            print(f"Error fetching {url}: {e}")
+            log.error("Error fetching %s: %s", url, e)
             return None
-    
-    
-    
+
+    def fetch_html(self, url: str) -> Optional[str]:
+        """Fetch a page and return the raw HTML without parsing."""
+        try:
+            wait = self._throttle_wait()
+            if wait > 0:
+                time.sleep(wait)  # Be respectful to servers
+            self._last_fetch = time.monotonic()
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            return response.text
+        except Exception as e:
+            log.error("Error fetching %s: %s", url, e)
+            return None
+
+    async def fetch_page_async(self, url: str, session: aiohttp.ClientSession) -> Optional[BeautifulSoup]:
+        """Async counterpart of fetch_page using a shared aiohttp session."""
+        try:
+            wait = self._throttle_wait()
+            if wait > 0:
+                await asyncio.sleep(wait)  # Be respectful to servers
+            self._last_fetch = time.monotonic()
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+                content = await response.read()
+            # Parsing is CPU-bound; keep it off the event loop
+            return await asyncio.to_thread(
+                BeautifulSoup, content, 'lxml', parse_only=_EVENT_STRAINER
+            )
+        except Exception as e:
+            log.error("Error fetching %s: %s", url, e)
+            return None
+
+    def fetch_pages(self, urls: List[str]) -> List[Optional[BeautifulSoup]]:
+        """
+        Fetch several pages concurrently (pagination, per-event detail pages).
+
+        Returns parsed pages in the same order as the input URLs, with None
+        for any page that failed to fetch.
+        """
+        async def _fetch_all():
+            connector = aiohttp.TCPConnector(limit=20)
+            async with aiohttp.ClientSession(
+                connector=connector, headers=dict(self.session.headers)
+            ) as session:
+                return await asyncio.gather(
+                    *(self.fetch_page_async(url, session) for url in urls)
+                )
+
+        return asyncio.run(_fetch_all())
+
     def extract_events(self, soup: BeautifulSoup) -> List[Dict]:
         """
         Extract events from a parsed page.
@@ -54,7 +249,7 @@ class EventScraper:
         events = []
         # This is a generic implementation - should be overridden
         # Look for common event patterns
-        event_elements = soup.find_all(['article', 'div', 'a'], class_=re.compile(r'event|show|concert', re.I), inner_text=re.compile(r'buy tickets|get tickets|buy|tickets|rsvp|more info|learn more|read more|view details|details|sold out|live music|', re.I))
+        event_elements = soup.find_all(['article', 'div', 'a'], class_=_RE_EVENT_CLASS, inner_text=_RE_TICKET_TEXT)
         
         for element in event_elements:
             event = self._parse_event_element(element)
@@ -66,35 +261,17 @@ class EventScraper:
     def _parse_event_element(self, element) -> Optional[Dict]:
         """Parse a single event element (generic implementation)."""
         # This is a basic implementation - should be customized per venue
-        event = {
-            'Hold Level': '1',
-            'Artist': '',
-            'Type': 'Confirm',
-            'Venue': self.venue_name,
-            'Event Name': '',
-            'Buyer': '',
-            'Promoter': '',
-            'Event End Time': '',
-            'Event Start Time': '',
-            'Event Door Time': '',
-            'Event Image URL': '',
-            'Notes': '',
-            'Venue Permalink': '',
-            'Description Text': '',
-            'Description Image': '',
-            'Description Video': '',
-            'Contacts': '',
-            'ID': ''
-        }
+        event = _EVENT_TEMPLATE.copy()
+        event['Venue'] = self.venue_name
         
         # Try to extract event name
-        name_elem = element.find(['h1', 'h2', 'h3', 'h4', 'a'], class_=re.compile(r'title|name|event', re.I))
+        name_elem = element.find(['h1', 'h2', 'h3', 'h4', 'a'], class_=_RE_TITLE_CLASS)
         if name_elem:
             event['Event Name'] = name_elem.get_text(strip=True)
             event['Artist'] = event['Event Name']  # Default to event name if no artist
         
         # Try to extract date/time
-        date_elem = element.find(['time', 'span', 'div'], class_=re.compile(r'date|time', re.I))
+        date_elem = element.find(['time', 'span', 'div'], class_=_RE_DATE_CLASS)
         if date_elem:
             date_text = date_elem.get_text(strip=True)
             event['Event Start Time'] = self._parse_date(date_text)
@@ -103,11 +280,11 @@ class EventScraper:
         img_elem = element.find('img')
         if img_elem and img_elem.get('src'):
             img_url = img_elem['src']
-            event['Event Image URL'] = urljoin(self.venue_url, img_url)
+            event['Event Image URL'] = self._join_url(img_url)
             event['Description Image'] = event['Event Image URL']
         
         # Try to extract description
-        desc_elem = element.find(['p', 'div'], class_=re.compile(r'description|summary', re.I))
+        desc_elem = element.find(['p', 'div'], class_=_RE_DESC_CLASS)
         if desc_elem:
             event['Description Text'] = desc_elem.get_text(strip=True)
         
@@ -129,7 +306,7 @@ class EventScraper:
         """
         events_page = self.venue_url
         if not events_page:
-            print(f"Could not find events page for {self.venue_name}")
+            log.warning("Could not find events page for %s", self.venue_name)
             return []
         
         soup = self.fetch_page(events_page)
@@ -137,36 +314,65 @@ class EventScraper:
             return []
         
         events = self.extract_events(soup)
-        print(f"Found {len(events)} events for {self.venue_name}")
+        log.info("Found %d events for %s", len(events), self.venue_name)
+        return events
+
+    async def scrape_async(self, session: aiohttp.ClientSession) -> List[Dict]:
+        """Async counterpart of scrape using a shared aiohttp session."""
+        events_page = self.venue_url
+        if not events_page:
+            log.warning("Could not find events page for %s", self.venue_name)
+            return []
+
+        soup = await self.fetch_page_async(events_page, session)
+        if not soup:
+            return []
+
+        events = self.extract_events(soup)
+        log.info("Found %d events for %s", len(events), self.venue_name)
         return events
 
 
+async def scrape_all(scrapers: List['EventScraper']) -> List[List[Dict]]:
+    """
+    Scrape many venues concurrently over one shared connection pool.
+
+    Wall time becomes roughly the slowest venue instead of the sum of all
+    of them. Returns each scraper's event list in input order.
+    """
+    semaphore = asyncio.Semaphore(16)
+
+    async def _bounded(scraper: EventScraper, session: aiohttp.ClientSession):
+        async with semaphore:
+            return await scraper.scrape_async(session)
+
+    connector = aiohttp.TCPConnector(limit_per_host=8)
+    async with aiohttp.ClientSession(
+        connector=connector, headers={'User-Agent': _USER_AGENT}
+    ) as session:
+        return await asyncio.gather(*(_bounded(s, session) for s in scrapers))
+
+
 class GenericScraper(EventScraper):
-   
-    
+
+    # Built once at import; venue subclasses can override with their own tables
+    NAME_SELECTORS = _NAME_SELECTORS
+    DATE_SELECTORS = _DATE_SELECTORS
+    DESC_SELECTORS = _DESC_SELECTORS
+
+
     def extract_events(self, soup: BeautifulSoup) -> List[Dict]:
         """Enhanced generic extraction with more patterns."""
         events = []
         
-        # Look for various event container patterns
-        selectors = [
-            {'class': re.compile(r'event', re.I)},
-            {'class': re.compile(r'show', re.I)},
-            {'class': re.compile(r'concert', re.I)},
-            {'class': re.compile(r'listing', re.I)},
-            {'class': re.compile(r'post', re.I)},
-            {'class': re.compile(r'card', re.I)},
-            {'itemtype': re.compile(r'Event', re.I)},
-            {'data-event': True},
-        ]
-        
-        event_elements = []
-        for selector in selectors:
-            found = soup.find_all(['article', 'div', 'li', 'section'], selector)
-            event_elements.extend(found)
+        # One traversal covers all six class keywords; two targeted passes
+        # pick up the schema.org and data-attribute variants
+        event_elements = soup.find_all(_CONTAINER_TAGS, class_=_RE_CONTAINER_CLASS)
+        event_elements.extend(soup.find_all(_CONTAINER_TAGS, itemtype=_RE_ITEMTYPE_EVENT))
+        event_elements.extend(soup.find_all(_CONTAINER_TAGS, attrs={'data-event': True}))
         
         # Also look for "Buy Tickets" links and find their parent containers
-        buy_ticket_links = soup.find_all('a', string=re.compile(r'buy\s+tickets?|get\s+tickets?', re.I))
+        buy_ticket_links = soup.find_all('a', string=_RE_BUY_TICKETS)
         for link in buy_ticket_links:
             # Find parent container (go up to find event container)
             parent = link.parent
@@ -201,79 +407,65 @@ class GenericScraper(EventScraper):
     
     def _parse_event_element_enhanced(self, element) -> Optional[Dict]:
         """Enhanced event parsing with more extraction patterns."""
-        event = {
-            'Hold Level': '1',
-            'Artist': '',
-            'Type': 'Confirm',
-            'Venue': self.venue_name,
-            'Event Name': '',
-            'Buyer': '',
-            'Promoter': '',
-            'Event End Time': '',
-            'Event Start Time': '',
-            'Event Door Time': '',
-            'Event Image URL': '',
-            'Notes': '',
-            'Venue Permalink': '',
-            'Description Text': '',
-            'Description Image': '',
-            'Description Video': '',
-            'Contacts': '',
-            'ID': ''
-        }
+        event = _EVENT_TEMPLATE.copy()
+        event['Venue'] = self.venue_name
         
-        # Extract event name from various possible locations
-        name_selectors = [
-            ('h1', {'class': re.compile(r'title|name|event', re.I)}),
-            ('h2', {'class': re.compile(r'title|name|event', re.I)}),
-            ('h3', {'class': re.compile(r'title|name|event', re.I)}),
-            ('a', {'class': re.compile(r'title|name|event', re.I)}),
-            ('span', {'class': re.compile(r'title|name|event', re.I)}),
-            ('div', {'class': re.compile(r'title|name|event', re.I)}),
-            ('h1', {}),
-            ('h2', {}),
-        ]
-        
-        # Filter out invalid event names
-        invalid_names = ['buy tickets', 'get tickets', 'buy', 'tickets', 'rsvp', 'more info', 
-                        'learn more', 'read more', 'view details', 'details', 'sold out']
-        
-        for tag, attrs in name_selectors:
-            name_elem = element.find(tag, attrs) if attrs else element.find(tag)
-            if name_elem:
-                name = name_elem.get_text(strip=True)
-                # Skip if it's an invalid name
-                if name and len(name) > 3 and name.lower() not in invalid_names:
-                    event['Event Name'] = name
-                    event['Artist'] = name  # Default
-                    break
-        # Try to extract 'Venue Permalink' from buttons or links with 'Get Tickets', 'Buy Tickets', or 'Buy' text
-        button_texts = ['get tickets', 'buy tickets', 'buy', 'sold out']
-        venue_permalink = ''
-        # Search for <a> and <button> tags
-        for tag in ['a', 'button']:
-            for btn in element.find_all(tag):
-                btn_text = btn.get_text(strip=True).lower()
-                if any(text in btn_text for text in button_texts):
-                    href = btn.get('href')
-                    if href:
-                        venue_permalink = urljoin(self.venue_url, href)
-                        break
-            if venue_permalink:
+        # One pass over the subtree bins the first matching node per selector
+        # row; the old code re-walked the element once per row
+        name_slots = [None] * len(self.NAME_SELECTORS)
+        date_slots = [None] * len(self.DATE_SELECTORS)
+        desc_slots = [None] * len(self.DESC_SELECTORS)
+        first_img = None
+
+        for node in element.descendants:
+            node_tag = getattr(node, 'name', None)
+            if node_tag is None:
+                continue
+            if node_tag == 'img':
+                if first_img is None:
+                    first_img = node
+                continue
+            classes = node.get('class')
+            class_text = ' '.join(classes) if classes else ''
+            for slots, selectors in (
+                (name_slots, self.NAME_SELECTORS),
+                (date_slots, self.DATE_SELECTORS),
+                (desc_slots, self.DESC_SELECTORS),
+            ):
+                for i, (tag, attrs) in enumerate(selectors):
+                    if slots[i] is None and node_tag == tag and (
+                        not attrs
+                        or (class_text and attrs['class'].search(class_text))
+                    ):
+                        slots[i] = node
+
+        # Resolve the name by selector priority
+        for name_elem in name_slots:
+            if name_elem is None:
+                continue
+            name = name_elem.get_text(strip=True)
+            # Skip if it's an invalid name
+            if name and len(name) > 3 and name.lower() not in _INVALID_NAMES:
+                event['Event Name'] = name
+                event['Artist'] = name  # Default
+                break
+
+        # The broad container selectors pull in plenty of non-event cards;
+        # without a name the event is discarded anyway, so stop here
+        if not event['Event Name']:
+            return None
+        # Try to extract 'Venue Permalink' from buttons or links with 'Get Tickets', 'Buy Tickets', or 'Buy' text.
+        # Matched on get_text(), not string=: ticket buttons routinely wrap
+        # an icon plus text, and string= only sees single-text-child tags
+        for btn in element.find_all(
+            lambda tag: tag.name in ('a', 'button') and _RE_BTN_TEXT.search(tag.get_text())
+        ):
+            href = btn.get('href')
+            if href:
+                event['Venue Permalink'] = self._join_url(href)
                 break
-        if venue_permalink:
-            event['Venue Permalink'] = venue_permalink
-        # Extract date/time - look more thoroughly
-        date_selectors = [
-            ('time', {}),
-            ('span', {'class': re.compile(r'date|time|when', re.I)}),
-            ('div', {'class': re.compile(r'date|time|when', re.I)}),
-            ('p', {'class': re.compile(r'date|time|when', re.I)}),
-            ('div', {'class': re.compile(r'meta|info', re.I)}),
-        ]
-        
         # First try to get datetime attribute from time tag
-        time_elem = element.find('time')
+        time_elem = date_slots[0]  # DATE_SELECTORS[0] is ('time', {})
         if time_elem:
             datetime_attr = time_elem.get('datetime')
             if datetime_attr:
@@ -285,35 +477,25 @@ class GenericScraper(EventScraper):
         
         # If no time tag, look for other date elements
         if not event['Event Start Time']:
-            for tag, attrs in date_selectors:
-                date_elem = element.find(tag, attrs) if attrs else element.find(tag)
-                if date_elem:
-                    date_text = date_elem.get_text(strip=True)
-                    # Filter out invalid date text (like "Buy Tickets")
-                    if date_text and date_text.lower() not in ['buy tickets', 'get tickets', 'buy', 'sold out']:
-                        event['Event Start Time'] = date_text
-                        break
+            for date_elem in date_slots:
+                if date_elem is None:
+                    continue
+                date_text = date_elem.get_text(strip=True)
+                # Filter out invalid date text (like "Buy Tickets")
+                if date_text and date_text.lower() not in _INVALID_DATE_TEXTS:
+                    event['Event Start Time'] = date_text
+                    break
         
         # Also search the entire element text for date patterns
         if not event['Event Start Time'] or 'Show:' in event['Event Start Time'] or 'Doors:' in event['Event Start Time']:
-            full_text = element.get_text(separator=' | ')
-            # Look for date patterns like "Monday, November 25, 2024" or "11/25/2024"
-            date_patterns = [
-                re.compile(r'(\w+day,?\s+\w+\s+\d{1,2},?\s+\d{4})', re.I),  # Monday, November 25, 2024
-                re.compile(r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', re.I),  # 11/25/2024 or 11-25-2024
-                re.compile(r'(\w+\s+\d{1,2},?\s+\d{4})', re.I),  # November 25, 2024
-            ]
-            
-            found_date = None
-            for pattern in date_patterns:
-                match = pattern.search(full_text)
-                if match:
-                    found_date = match.group(1)
-                    break
+            # Materialized once and shared by the date and time searches;
+            # single-char separator avoids a 3-char join per node
+            full_text = element.get_text(separator=' ')
+            date_match = _RE_ANY_DATE.search(full_text)
+            found_date = date_match.group(0) if date_match else None
             
             # Also look for time patterns
-            time_pattern = re.compile(r'(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))', re.I)
-            time_match = time_pattern.search(full_text)
+            time_match = _RE_TIME.search(full_text)
             found_time = time_match.group(1) if time_match else None
             
             # Combine date and time if found
@@ -326,11 +508,11 @@ class GenericScraper(EventScraper):
                 event['Event Start Time'] = found_time
         
         # Extract image - look more thoroughly, including background images
-        img_elem = element.find('img')
+        img_elem = first_img
         if img_elem:
             img_url = img_elem.get('src') or img_elem.get('data-src') or img_elem.get('data-lazy-src') or img_elem.get('data-original')
             if img_url and not img_url.startswith('data:') and 'placeholder' not in img_url.lower():
-                event['Event Image URL'] = urljoin(self.venue_url, img_url)
+                event['Event Image URL'] = self._join_url(img_url)
                 event['Description Image'] = event['Event Image URL']
         
         # Also check for background images in style attributes
@@ -341,11 +523,11 @@ class GenericScraper(EventScraper):
                 if check_elem:
                     style = check_elem.get('style', '')
                     if style and 'background-image' in style:
-                        bg_match = re.search(r'background-image:\s*url\(["\']?([^"\']+)["\']?\)', style, re.I)
+                        bg_match = _RE_BG_IMAGE.search(style)
                         if bg_match:
                             img_url = bg_match.group(1)
                             if not img_url.startswith('data:'):
-                                event['Event Image URL'] = urljoin(self.venue_url, img_url)
+                                event['Event Image URL'] = self._join_url(img_url)
                                 event['Description Image'] = event['Event Image URL']
                                 break
                     check_elem = check_elem.parent if check_elem else None
@@ -353,19 +535,13 @@ class GenericScraper(EventScraper):
                     break
         
         # Extract description
-        desc_selectors = [
-            ('p', {'class': re.compile(r'description|summary|excerpt', re.I)}),
-            ('div', {'class': re.compile(r'description|summary|excerpt', re.I)}),
-            ('p', {}),
-        ]
-        
-        for tag, attrs in desc_selectors:
-            desc_elem = element.find(tag, attrs) if attrs else element.find(tag)
-            if desc_elem:
-                desc = desc_elem.get_text(strip=True)
-                if desc and len(desc) > 10:  # Valid description
-                    event['Description Text'] = desc
-                    break
+        for desc_elem in desc_slots:
+            if desc_elem is None:
+                continue
+            desc = desc_elem.get_text(strip=True)
+            if desc and len(desc) > 10:  # Valid description
+                event['Description Text'] = desc
+                break
         
         return event if event['Event Name'] else None
 